@@ -1,10 +1,20 @@
+import hashlib
 import os
+import queue
+import re
 import sqlite3
-import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
-from flask import Flask, render_template, request, jsonify
+from cachetools import TTLCache
+from flask import Flask, render_template, request
 from dotenv import load_dotenv
+import orjson
 import requests
+import zstandard
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Load environment variables
 load_dotenv()
@@ -19,14 +29,168 @@ ORG_ID = os.getenv("CENSYS_ORG_ID")
 LEGACY_URL = "https://search.censys.io/api/v2/hosts/search"
 NEW_URL = "https://api.platform.censys.io/v3/global/search/query"
 
+# Matches a dotted-quad IPv4 hostname such as "192.0.2.1"
+_IPV4_RE = re.compile(
+    r'\A[0-9]{1,3}\.[0-9]{1,3}\.[0-9]{1,3}\.[0-9]{1,3}\Z'
+).match
+
+# Per-request timeout (seconds) for every page fetched from either API
+REQUEST_TIMEOUT = 30
+
+# Shared HTTP session so connections to both APIs are kept alive and reused
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(
+        total=2,
+        backoff_factor=0.2,
+        status_forcelist=[429, 502, 503, 504],
+        allowed_methods=["GET", "POST"],
+        raise_on_status=False
+    )
+))
+
+# Each in-flight /compare borrows one worker for its Legacy API fetch while
+# the request thread fetches from the New API, so this is the number of
+# comparisons per process that can fetch at once; size it to the expected
+# request concurrency (e.g. gunicorn's --worker-connections)
+COMPARE_WORKERS = int(os.getenv("CENSYS_COMPARE_WORKERS", "32"))
+EXECUTOR = ThreadPoolExecutor(max_workers=COMPARE_WORKERS)
+
+# Short-lived cache of serialized /compare responses, keyed by request
+_CMP_CACHE = TTLCache(maxsize=256, ttl=60)
+_CMP_CACHE_LOCK = threading.Lock()
+_CMP_KEY_LOCKS = {}
+
 # Database setup
 DB_FILE = "censys_searches.db"
 
+# Statements run per request, kept identical so sqlite3's statement cache
+# reuses the prepared form instead of re-parsing the SQL
+# Saves are stamped to the millisecond, so the /load-searches ETag (which
+# fingerprints MAX(timestamp)) changes even for writes in the same second
+SQL_UPSERT_SEARCH = (
+    'INSERT INTO saved_searches '
+    '(name, legacy_query, new_query, virtual_hosts, fetch_all, '
+    'fetch_all_timestamp, results, summary, timestamp) '
+    'VALUES (?, ?, ?, ?, ?, ?, ?, ?, '
+    "strftime('%Y-%m-%d %H:%M:%f', 'now')) "
+    'ON CONFLICT(name) DO UPDATE SET '
+    'legacy_query = excluded.legacy_query, '
+    'new_query = excluded.new_query, '
+    'virtual_hosts = excluded.virtual_hosts, '
+    'fetch_all = excluded.fetch_all, '
+    'fetch_all_timestamp = excluded.fetch_all_timestamp, '
+    'results = excluded.results, '
+    'summary = excluded.summary, '
+    'timestamp = excluded.timestamp '
+    'WHERE ?'
+)
+SQL_SELECT_FINGERPRINT = (
+    "SELECT COUNT(*), COALESCE(MAX(id), 0), COALESCE(MAX(timestamp), '') "
+    "FROM saved_searches"
+)
+SQL_SELECT_ALL = (
+    'SELECT id, name, legacy_query, new_query, virtual_hosts, '
+    'fetch_all, fetch_all_timestamp, summary, timestamp '
+    'FROM saved_searches ORDER BY timestamp DESC, id DESC'
+)
+SQL_SELECT_PAGE = (
+    'SELECT id, name, legacy_query, new_query, virtual_hosts, '
+    'fetch_all, fetch_all_timestamp, summary, timestamp '
+    'FROM saved_searches ORDER BY timestamp DESC, id DESC LIMIT ?'
+)
+SQL_SELECT_PAGE_AFTER = (
+    'SELECT id, name, legacy_query, new_query, virtual_hosts, '
+    'fetch_all, fetch_all_timestamp, summary, timestamp '
+    'FROM saved_searches WHERE (timestamp, id) < (?, ?) '
+    'ORDER BY timestamp DESC, id DESC LIMIT ?'
+)
+SQL_SELECT_RESULTS_BY_ID = 'SELECT results FROM saved_searches WHERE id = ?'
+SQL_DELETE_BY_ID = 'DELETE FROM saved_searches WHERE id = ?'
+
+# Process-wide pool of SQLite connections, reused across requests and
+# threads; a connection is only ever used by one request at a time
+_pool = queue.LifoQueue()
+
+# The schema is set up once per process, on first database access
+_db_initialized = False
+_db_init_lock = threading.Lock()
+
+
+def _open_conn():
+    """Open a new pooled SQLite connection."""
+    # Autocommit mode; each statement commits on its own
+    conn = sqlite3.connect(
+        DB_FILE, isolation_level=None, cached_statements=256,
+        check_same_thread=False
+    )
+    cursor = conn.cursor()
+    cursor.execute('PRAGMA synchronous=NORMAL')
+    cursor.execute('PRAGMA temp_store=MEMORY')
+    cursor.execute('PRAGMA cache_size=-20000')
+    return conn
+
+
+@contextmanager
+def get_conn():
+    """Borrow a connection from the pool, opening one if none is idle."""
+    try:
+        conn = _pool.get_nowait()
+    except queue.Empty:
+        conn = _open_conn()
+    try:
+        if not _db_initialized:
+            _ensure_db(conn)
+        yield conn
+    finally:
+        # Never hand an open transaction to the next borrower
+        if conn.in_transaction:
+            conn.rollback()
+        _pool.put(conn)
+
+
+def _ensure_db(conn):
+    """Run init_db() once per process, before the first query."""
+    global _db_initialized
+    with _db_init_lock:
+        if not _db_initialized:
+            init_db(conn)
+            _db_initialized = True
 
-def init_db():
+
+def _encode_results(results):
+    """Encode saved results as a zstd-compressed JSON blob."""
+    return zstandard.compress(orjson.dumps(results), level=3)
+
+
+def _decode_results(value):
+    """Decode saved results, accepting older uncompressed JSON text rows."""
+    if isinstance(value, bytes):
+        return orjson.loads(zstandard.decompress(value))
+    return orjson.loads(value)
+
+
+def _summarize_results(results):
+    """Reduce saved results to the counts shown in the saved-search list."""
+    try:
+        return {
+            'legacy_total': results['legacy'].get('total') or 0,
+            'new_total': results['new'].get('total') or 0,
+            'missing_in_new': len(
+                (results.get('comparison') or {}).get('missing_in_new') or ()
+            )
+        }
+    except (AttributeError, KeyError, TypeError):
+        return None
+
+
+def init_db(conn):
     """Initialize the SQLite database."""
-    conn = sqlite3.connect(DB_FILE)
     cursor = conn.cursor()
+    # WAL is persistent, so readers stop blocking the writer from here on
+    cursor.execute('PRAGMA journal_mode=WAL')
     cursor.execute('''
         CREATE TABLE IF NOT EXISTS saved_searches (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -36,7 +200,8 @@ def init_db():
             virtual_hosts TEXT DEFAULT 'INCLUDE',
             fetch_all INTEGER DEFAULT 0,
             fetch_all_timestamp TEXT,
-            results TEXT NOT NULL,
+            results BLOB NOT NULL,
+            summary TEXT,
             timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
         )
     ''')
@@ -58,12 +223,45 @@ def init_db():
             'ALTER TABLE saved_searches ADD COLUMN '
             'fetch_all_timestamp TEXT'
         )
-    conn.commit()
-    conn.close()
+    if 'summary' not in columns:
+        cursor.execute(
+            'ALTER TABLE saved_searches ADD COLUMN '
+            'summary TEXT'
+        )
+    # Backfill list summaries for rows saved before the column existed
+    cursor.execute(
+        'SELECT id, results FROM saved_searches WHERE summary IS NULL'
+    )
+    for search_id, results in cursor.fetchall():
+        # An undecodable row gets a null summary rather than failing setup
+        try:
+            summary = _summarize_results(_decode_results(results))
+        except (orjson.JSONDecodeError, zstandard.ZstdError):
+            summary = None
+        cursor.execute(
+            'UPDATE saved_searches SET summary = ? WHERE id = ?',
+            (orjson.dumps(summary).decode(), search_id)
+        )
+    # Names are unique; keep only the newest row for any older duplicates
+    cursor.execute(
+        'DELETE FROM saved_searches WHERE id NOT IN '
+        '(SELECT MAX(id) FROM saved_searches GROUP BY name)'
+    )
+    cursor.execute(
+        'CREATE UNIQUE INDEX IF NOT EXISTS idx_saved_searches_name '
+        'ON saved_searches(name)'
+    )
+    cursor.execute(
+        'CREATE INDEX IF NOT EXISTS idx_saved_searches_timestamp '
+        'ON saved_searches(timestamp, id)'
+    )
 
 
-# Initialize database on startup
-init_db()
+def _json_response(obj, status=200):
+    """Serialize obj with orjson into a JSON response."""
+    return app.response_class(
+        orjson.dumps(obj), status=status, mimetype='application/json'
+    )
 
 
 def get_legacy_results(query, limit=100, virtual_hosts="INCLUDE",
@@ -83,17 +281,20 @@ def get_legacy_results(query, limit=100, virtual_hosts="INCLUDE",
 
     try:
         # Fetch first page
-        response = requests.get(LEGACY_URL, auth=auth, params=params)
+        response = SESSION.get(
+            LEGACY_URL, auth=auth, params=params, timeout=REQUEST_TIMEOUT
+        )
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
 
         result = data.get("result", {})
         total_hits = result.get("total", 0)
         hits = result.get("hits", [])
 
         for hit in hits:
-            if "ip" in hit:
-                ips.add(hit["ip"])
+            ip = hit.get("ip")
+            if ip is not None:
+                ips.add(ip)
 
         # Paginate if fetch_all is enabled
         if fetch_all:
@@ -103,20 +304,21 @@ def get_legacy_results(query, limit=100, virtual_hosts="INCLUDE",
                     # Use cursor parameter for pagination
                     next_params = params.copy()
                     next_params["cursor"] = cursor
-                    response = requests.get(
+                    response = SESSION.get(
                         LEGACY_URL,
                         auth=auth,
                         params=next_params,
-                        timeout=30
+                        timeout=REQUEST_TIMEOUT
                     )
                     response.raise_for_status()
-                    data = response.json()
+                    data = orjson.loads(response.content)
                     result = data.get("result", {})
                     hits = result.get("hits", [])
 
                     for hit in hits:
-                        if "ip" in hit:
-                            ips.add(hit["ip"])
+                        ip = hit.get("ip")
+                        if ip is not None:
+                            ips.add(ip)
 
                     # Get next cursor for next iteration
                     cursor = result.get("links", {}).get("next")
@@ -128,10 +330,43 @@ def get_legacy_results(query, limit=100, virtual_hosts="INCLUDE",
         error = str(e)
         if hasattr(e, 'response') and e.response is not None:
             error += f" - {e.response.text}"
+    except orjson.JSONDecodeError as e:
+        error = f"Invalid JSON response: {str(e)}"
 
     return ips, total_hits, error
 
 
+def extract_ips_from_hits(hits):
+    """Helper to extract IPs from New API hit results."""
+    extracted = set()
+    for hit in hits:
+        # Try webproperty_v1 structure
+        if 'webproperty_v1' in hit:
+            resource = hit['webproperty_v1'].get('resource', {})
+            hostname = resource.get('hostname')
+            if hostname is not None and _IPV4_RE(hostname):
+                extracted.add(hostname)
+            for endpoint in resource.get('endpoints', ()):
+                ip = endpoint.get('ip')
+                if ip is not None:
+                    extracted.add(ip)
+
+        # Try host_v1 structure
+        elif 'host_v1' in hit:
+            ip = hit['host_v1'].get('resource', {}).get('ip')
+            if ip is not None:
+                extracted.add(ip)
+
+        # Fallback: direct keys
+        else:
+            ip = hit.get("ip")
+            if ip is None:
+                ip = hit.get("ip_address")
+            if ip is not None:
+                extracted.add(ip)
+    return extracted
+
+
 def get_new_results(query, limit=100, fetch_all=False):
     """Fetch results from New Censys Platform API."""
     ips = set()
@@ -152,40 +387,13 @@ def get_new_results(query, limit=100, fetch_all=False):
         "page_size": limit
     }
 
-    def extract_ips_from_hits(hits):
-        """Helper to extract IPs from hit results."""
-        extracted = set()
-        for hit in hits:
-            # Try webproperty_v1 structure
-            if 'webproperty_v1' in hit:
-                resource = hit['webproperty_v1'].get('resource', {})
-                if 'hostname' in resource:
-                    hostname = resource['hostname']
-                    if hostname.replace('.', '').isdigit():
-                        extracted.add(hostname)
-                endpoints = resource.get('endpoints', [])
-                for endpoint in endpoints:
-                    if 'ip' in endpoint:
-                        extracted.add(endpoint['ip'])
-
-            # Try host_v1 structure
-            elif 'host_v1' in hit:
-                resource = hit['host_v1'].get('resource', {})
-                if 'ip' in resource:
-                    extracted.add(resource['ip'])
-
-            # Fallback: direct keys
-            elif "ip" in hit:
-                extracted.add(hit["ip"])
-            elif "ip_address" in hit:
-                extracted.add(hit["ip_address"])
-        return extracted
-
     try:
         # Fetch first page
-        response = requests.post(NEW_URL, headers=headers, json=payload)
+        response = SESSION.post(
+            NEW_URL, headers=headers, json=payload, timeout=REQUEST_TIMEOUT
+        )
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
 
         result = data.get("result", {})
         hits = result.get("hits", [])
@@ -204,14 +412,14 @@ def get_new_results(query, limit=100, fetch_all=False):
                     # Use the cursor token in the payload
                     next_payload = payload.copy()
                     next_payload["cursor"] = cursor
-                    response = requests.post(
+                    response = SESSION.post(
                         NEW_URL,
                         headers=headers,
                         json=next_payload,
-                        timeout=30
+                        timeout=REQUEST_TIMEOUT
                     )
                     response.raise_for_status()
-                    data = response.json()
+                    data = orjson.loads(response.content)
                     result = data.get("result", {})
                     hits = result.get("hits", [])
 
@@ -227,42 +435,75 @@ def get_new_results(query, limit=100, fetch_all=False):
         error = str(e)
         if hasattr(e, 'response') and e.response is not None:
             error += f" - {e.response.text}"
+    except orjson.JSONDecodeError as e:
+        error = f"Invalid JSON response: {str(e)}"
 
     return ips, total_hits, error
 
 
+def diff_sorted_ips(legacy_sorted, new_sorted):
+    """Split two sorted, de-duplicated IP lists in a single merge pass.
+
+    Returns (missing_in_new, only_in_new, common_count), with both lists
+    already in sorted order.
+    """
+    # Identical or one-sided results need no merge walk
+    if not legacy_sorted or not new_sorted:
+        return list(legacy_sorted), list(new_sorted), 0
+    if legacy_sorted == new_sorted:
+        return [], [], len(legacy_sorted)
+
+    missing_in_new = []
+    only_in_new = []
+    common_count = 0
+    i = j = 0
+    legacy_len = len(legacy_sorted)
+    new_len = len(new_sorted)
+
+    while i < legacy_len and j < new_len:
+        legacy_ip = legacy_sorted[i]
+        new_ip = new_sorted[j]
+        if legacy_ip == new_ip:
+            common_count += 1
+            i += 1
+            j += 1
+        elif legacy_ip < new_ip:
+            missing_in_new.append(legacy_ip)
+            i += 1
+        else:
+            only_in_new.append(new_ip)
+            j += 1
+
+    missing_in_new.extend(legacy_sorted[i:])
+    only_in_new.extend(new_sorted[j:])
+    return missing_in_new, only_in_new, common_count
+
+
 @app.route('/')
 def index():
     """Render the main page."""
     return render_template('index.html')
 
 
-@app.route('/compare', methods=['POST'])
-def compare():
-    """Compare queries between Legacy and New APIs."""
-    data = request.get_json()
-    legacy_query = data.get('legacy_query', '').strip()
-    new_query = data.get('new_query', '').strip()
-    virtual_hosts = data.get('virtual_hosts', 'EXCLUDE')
-    fetch_all = data.get('fetch_all', False)
-
-    if not legacy_query or not new_query:
-        return jsonify({
-            'error': 'Both queries are required'
-        }), 400
-
-    # Fetch results from both APIs
-    legacy_ips, legacy_total, legacy_error = get_legacy_results(
+def run_comparison(legacy_query, new_query, virtual_hosts, fetch_all):
+    """Query both APIs and build the comparison result."""
+    # Fetch results from both APIs concurrently: Legacy on the pool, New on
+    # the request thread
+    legacy_future = EXECUTOR.submit(
+        get_legacy_results,
         legacy_query, virtual_hosts=virtual_hosts, fetch_all=fetch_all
     )
     new_ips, new_total, new_error = get_new_results(
         new_query, fetch_all=fetch_all
     )
+    legacy_ips, legacy_total, legacy_error = legacy_future.result()
 
-    # Calculate differences
-    missing_in_new = legacy_ips - new_ips
-    only_in_new = new_ips - legacy_ips
-    common_ips = legacy_ips & new_ips
+    # Sort each side once, then calculate differences with a merge walk
+    legacy_sorted = sorted(legacy_ips)
+    new_sorted = sorted(new_ips)
+    missing_in_new, only_in_new, common_count = diff_sorted_ips(
+        legacy_sorted, new_sorted
+    )
 
     # Determine status
     if legacy_error or new_error:
@@ -272,26 +513,71 @@ def compare():
     else:
         status = 'success'
 
-    return jsonify({
+    return {
         'status': status,
         'legacy': {
             'total': legacy_total,
-            'fetched': len(legacy_ips),
-            'ips': sorted(list(legacy_ips)),
+            'fetched': len(legacy_sorted),
+            'ips': legacy_sorted,
             'error': legacy_error
         },
         'new': {
             'total': new_total,
-            'fetched': len(new_ips),
-            'ips': sorted(list(new_ips)),
+            'fetched': len(new_sorted),
+            'ips': new_sorted,
             'error': new_error
         },
         'comparison': {
-            'common': len(common_ips),
-            'missing_in_new': sorted(list(missing_in_new)),
-            'only_in_new': sorted(list(only_in_new))
+            'common': common_count,
+            'missing_in_new': missing_in_new,
+            'only_in_new': only_in_new
         }
-    })
+    }
+
+
+@app.route('/compare', methods=['POST'])
+def compare():
+    """Compare queries between Legacy and New APIs."""
+    data = request.get_json()
+    legacy_query = data.get('legacy_query', '').strip()
+    new_query = data.get('new_query', '').strip()
+    virtual_hosts = data.get('virtual_hosts', 'EXCLUDE')
+    fetch_all = data.get('fetch_all', False)
+
+    if not legacy_query or not new_query:
+        return _json_response({
+            'error': 'Both queries are required'
+        }, status=400)
+
+    key = (legacy_query, new_query, virtual_hosts, bool(fetch_all))
+
+    with _CMP_CACHE_LOCK:
+        body = _CMP_CACHE.get(key)
+        if body is None:
+            key_lock = _CMP_KEY_LOCKS.setdefault(key, threading.Lock())
+
+    if body is None:
+        # Concurrent misses on the same key wait here for a single fetch
+        try:
+            with key_lock:
+                with _CMP_CACHE_LOCK:
+                    body = _CMP_CACHE.get(key)
+                if body is None:
+                    result = run_comparison(
+                        legacy_query, new_query, virtual_hosts, fetch_all
+                    )
+                    body = orjson.dumps(result)
+                    # Errors are not cached so the next request retries them
+                    if result['status'] != 'error':
+                        with _CMP_CACHE_LOCK:
+                            _CMP_CACHE[key] = body
+        finally:
+            # Only drop our own lock; a newer miss may have replaced it
+            with _CMP_CACHE_LOCK:
+                if _CMP_KEY_LOCKS.get(key) is key_lock:
+                    del _CMP_KEY_LOCKS[key]
+
+    return app.response_class(body, mimetype='application/json')
 
 
 @app.route('/save-search', methods=['POST'])
@@ -307,66 +593,90 @@ def save_search():
     overwrite = data.get('overwrite', False)
 
     if not name:
-        return jsonify({'error': 'Name is required'}), 400
+        return _json_response({'error': 'Name is required'}, status=400)
 
     # Get current timestamp if fetch_all was used
     fetch_all_timestamp = None
     if fetch_all:
         fetch_all_timestamp = datetime.now().isoformat()
 
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
-
-    # Check if name already exists
-    cursor.execute('SELECT id FROM saved_searches WHERE name = ?', (name,))
-    existing = cursor.fetchone()
+    # Encode before taking the write lock so the transaction stays short
+    params = (
+        name, legacy_query, new_query, virtual_hosts, int(fetch_all),
+        fetch_all_timestamp, _encode_results(results),
+        orjson.dumps(_summarize_results(results)).decode(),
+        int(bool(overwrite))
+    )
 
-    if existing and not overwrite:
-        conn.close()
-        return jsonify({
+    with get_conn() as conn:
+        cursor = conn.cursor()
+
+        # Insert, or update the existing row with this name when
+        # overwriting, as one explicit write transaction
+        cursor.execute('BEGIN IMMEDIATE')
+        try:
+            cursor.execute(SQL_UPSERT_SEARCH, params)
+            saved = cursor.rowcount
+            cursor.execute('COMMIT')
+        except sqlite3.Error:
+            cursor.execute('ROLLBACK')
+            raise
+
+    # Nothing was written: the name exists and overwrite was not requested
+    if saved == 0:
+        return _json_response({
             'duplicate': True,
             'message': 'A search with this name already exists'
-        }), 409
-
-    if existing and overwrite:
-        # Update existing entry
-        cursor.execute(
-            'UPDATE saved_searches SET legacy_query = ?, new_query = ?, '
-            'virtual_hosts = ?, fetch_all = ?, fetch_all_timestamp = ?, '
-            'results = ?, timestamp = CURRENT_TIMESTAMP '
-            'WHERE name = ?',
-            (legacy_query, new_query, virtual_hosts, int(fetch_all),
-             fetch_all_timestamp, json.dumps(results), name)
-        )
-    else:
-        # Insert new entry
-        cursor.execute(
-            'INSERT INTO saved_searches '
-            '(name, legacy_query, new_query, virtual_hosts, fetch_all, '
-            'fetch_all_timestamp, results) '
-            'VALUES (?, ?, ?, ?, ?, ?, ?)',
-            (name, legacy_query, new_query, virtual_hosts, int(fetch_all),
-             fetch_all_timestamp, json.dumps(results))
-        )
-
-    conn.commit()
-    conn.close()
+        }, status=409)
 
-    return jsonify({'success': True, 'message': 'Search saved successfully'})
+    return _json_response(
+        {'success': True, 'message': 'Search saved successfully'}
+    )
 
 
 @app.route('/load-searches', methods=['GET'])
 def load_searches():
-    """Load all saved searches from the database."""
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
-    cursor.execute(
-        'SELECT id, name, legacy_query, new_query, virtual_hosts, '
-        'fetch_all, fetch_all_timestamp, results, timestamp '
-        'FROM saved_searches ORDER BY timestamp DESC'
-    )
-    rows = cursor.fetchall()
-    conn.close()
+    """Load the saved search list (metadata only), optionally paged."""
+    # Without page_size the whole list is returned, so the frontend can
+    # sort and filter across every saved search
+    page_size = request.args.get('page_size', type=int)
+    if page_size is not None:
+        page_size = min(max(page_size, 1), 100)
+    cursor_timestamp = request.args.get('cursor_timestamp')
+    cursor_id = request.args.get('cursor_id', type=int)
+
+    with get_conn() as conn:
+        cursor = conn.cursor()
+
+        # Cheap fingerprint of the table; unchanged means the client is
+        # current
+        cursor.execute(SQL_SELECT_FINGERPRINT)
+        count, max_id, max_timestamp = cursor.fetchone()
+        etag = hashlib.blake2b(
+            f"{count}:{max_id}:{max_timestamp}".encode(), digest_size=16
+        ).hexdigest()
+        if request.if_none_match.contains(etag):
+            response = app.response_class(status=304)
+            response.set_etag(etag)
+            return response
+
+        # Keyset pagination on (timestamp, id), newest first; the extra row
+        # only tells us whether another page follows
+        if page_size is None:
+            cursor.execute(SQL_SELECT_ALL)
+        elif cursor_timestamp is not None and cursor_id is not None:
+            cursor.execute(
+                SQL_SELECT_PAGE_AFTER,
+                (cursor_timestamp, cursor_id, page_size + 1)
+            )
+        else:
+            cursor.execute(SQL_SELECT_PAGE, (page_size + 1,))
+        rows = cursor.fetchall()
+
+    next_cursor = None
+    if page_size is not None and len(rows) > page_size:
+        rows = rows[:page_size]
+        next_cursor = {'timestamp': rows[-1][8], 'id': rows[-1][0]}
 
     searches = []
     for row in rows:
@@ -378,23 +688,42 @@ def load_searches():
             'virtual_hosts': row[4],
             'fetch_all': bool(row[5]),
             'fetch_all_timestamp': row[6],
-            'results': json.loads(row[7]),
+            'summary': orjson.loads(row[7]) if row[7] else None,
             'timestamp': row[8]
         })
 
-    return jsonify(searches)
+    response = _json_response({'items': searches, 'next_cursor': next_cursor})
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+
+@app.route('/load-search/<int:search_id>', methods=['GET'])
+def load_search(search_id):
+    """Load the full results of a single saved search."""
+    with get_conn() as conn:
+        cursor = conn.cursor()
+        cursor.execute(SQL_SELECT_RESULTS_BY_ID, (search_id,))
+        row = cursor.fetchone()
+
+    if row is None:
+        return _json_response({'error': 'Search not found'}, status=404)
+
+    return _json_response({
+        'id': search_id,
+        'results': _decode_results(row[0])
+    })
 
 
 @app.route('/delete-search/<int:search_id>', methods=['DELETE'])
 def delete_search(search_id):
     """Delete a saved search from the database."""
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
-    cursor.execute('DELETE FROM saved_searches WHERE id = ?', (search_id,))
-    conn.commit()
-    conn.close()
+    with get_conn() as conn:
+        conn.execute(SQL_DELETE_BY_ID, (search_id,))
 
-    return jsonify({'success': True, 'message': 'Search deleted successfully'})
+    return _json_response(
+        {'success': True, 'message': 'Search deleted successfully'}
+    )
 
 
 if __name__ == '__main__':
@@ -404,4 +733,7 @@ if __name__ == '__main__':
 
     print("Starting Censys API Comparison Web App...")
     print("Open http://localhost:5000 in your browser")
+    print("This is a development server; for deployment use gunicorn:")
+    print("  CENSYS_COMPARE_WORKERS=200 gunicorn -k gevent -w 2 "
+          "--worker-connections 200 -b 0.0.0.0:5000 app:app")
     app.run(debug=True, port=5000)